@@ -23,7 +23,7 @@ from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.util import Throttle
 
-from .const import DOMAIN, KEY_MAC, TIMEOUT
+from .const import DOMAIN, KEY_MAC, MANUFACTURER, TIMEOUT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -52,7 +52,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not daikin_api:
         return False
 
-    hass.data.setdefault(DOMAIN, {}).update({entry.entry_id: daikin_api})
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = daikin_api
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
@@ -122,7 +122,7 @@ class DaikinApi:
         info = self.device.values
         return DeviceInfo(
             connections={(CONNECTION_NETWORK_MAC, self.device.mac)},
-            manufacturer="Daikin",
+            manufacturer=MANUFACTURER,
             model=info.get("model"),
             name=info.get("name"),
             sw_version=info.get("ver", "").replace("_", "."),
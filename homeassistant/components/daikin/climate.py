@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 from typing import Any
 
 import voluptuous as vol
@@ -48,46 +49,49 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {vol.Required(CONF_HOST): cv.string, vol.Optional(CONF_NAME): cv.string}
 )
 
-HA_STATE_TO_DAIKIN = {
-    HVACMode.FAN_ONLY: "fan",
-    HVACMode.DRY: "dry",
-    HVACMode.COOL: "cool",
-    HVACMode.HEAT: "hot",
-    HVACMode.HEAT_COOL: "auto",
-    HVACMode.OFF: "off",
-}
-
-DAIKIN_TO_HA_STATE = {
-    "fan": HVACMode.FAN_ONLY,
-    "dry": HVACMode.DRY,
-    "cool": HVACMode.COOL,
-    "hot": HVACMode.HEAT,
-    "auto": HVACMode.HEAT_COOL,
-    "off": HVACMode.OFF,
-}
-
-HA_STATE_TO_CURRENT_HVAC = {
-    HVACMode.COOL: HVACAction.COOLING,
-    HVACMode.HEAT: HVACAction.HEATING,
-    HVACMode.OFF: HVACAction.OFF,
-}
-
-HA_PRESET_TO_DAIKIN = {
-    PRESET_AWAY: "on",
-    PRESET_NONE: "off",
-    PRESET_BOOST: "powerful",
-    PRESET_ECO: "econo",
-}
-
-HA_ATTR_TO_DAIKIN = {
-    ATTR_PRESET_MODE: "en_hol",
-    ATTR_HVAC_MODE: "mode",
-    ATTR_FAN_MODE: "f_rate",
-    ATTR_SWING_MODE: "f_dir",
-    ATTR_INSIDE_TEMPERATURE: "htemp",
-    ATTR_OUTSIDE_TEMPERATURE: "otemp",
-    ATTR_TARGET_TEMPERATURE: "stemp",
-}
+HA_STATE_TO_DAIKIN = MappingProxyType(
+    {
+        HVACMode.FAN_ONLY: "fan",
+        HVACMode.DRY: "dry",
+        HVACMode.COOL: "cool",
+        HVACMode.HEAT: "hot",
+        HVACMode.HEAT_COOL: "auto",
+        HVACMode.OFF: "off",
+    }
+)
+
+DAIKIN_TO_HA_STATE = MappingProxyType(
+    {value: key for key, value in HA_STATE_TO_DAIKIN.items()}
+)
+
+HA_STATE_TO_CURRENT_HVAC = MappingProxyType(
+    {
+        HVACMode.COOL: HVACAction.COOLING,
+        HVACMode.HEAT: HVACAction.HEATING,
+        HVACMode.OFF: HVACAction.OFF,
+    }
+)
+
+HA_PRESET_TO_DAIKIN = MappingProxyType(
+    {
+        PRESET_AWAY: "on",
+        PRESET_NONE: "off",
+        PRESET_BOOST: "powerful",
+        PRESET_ECO: "econo",
+    }
+)
+
+HA_ATTR_TO_DAIKIN = MappingProxyType(
+    {
+        ATTR_PRESET_MODE: "en_hol",
+        ATTR_HVAC_MODE: "mode",
+        ATTR_FAN_MODE: "f_rate",
+        ATTR_SWING_MODE: "f_dir",
+        ATTR_INSIDE_TEMPERATURE: "htemp",
+        ATTR_OUTSIDE_TEMPERATURE: "otemp",
+        ATTR_TARGET_TEMPERATURE: "stemp",
+    }
+)
 
 DAIKIN_ATTR_ADVANCED = "adv"
 
@@ -123,15 +127,19 @@ class DaikinClimate(ClimateEntity):
 
     _attr_name = None
     _attr_has_entity_name = True
+    _attr_hvac_modes = list(HA_STATE_TO_DAIKIN)
+    _attr_target_temperature_step = 1
     _attr_temperature_unit = UnitOfTemperature.CELSIUS
 
     def __init__(self, api: DaikinApi) -> None:
         """Initialize the climate device."""
 
         self._api = api
-        self._attr_hvac_modes = list(HA_STATE_TO_DAIKIN)
-        self._attr_fan_modes = self._api.device.fan_rate
-        self._attr_swing_modes = self._api.device.swing_modes
+        device = api.device
+        self._attr_unique_id = device.mac
+        self._attr_device_info = api.device_info
+        self._attr_fan_modes = device.fan_rate
+        self._attr_swing_modes = device.swing_modes
         self._list = {
             ATTR_HVAC_MODE: self._attr_hvac_modes,
             ATTR_FAN_MODE: self._attr_fan_modes,
@@ -140,16 +148,19 @@ class DaikinClimate(ClimateEntity):
 
         self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
 
-        if (
-            self._api.device.support_away_mode
-            or self._api.device.support_advanced_modes
-        ):
+        self._attr_preset_modes = [PRESET_NONE]
+        if device.support_away_mode:
+            self._attr_preset_modes.append(PRESET_AWAY)
+        if device.support_advanced_modes:
+            self._attr_preset_modes += [PRESET_ECO, PRESET_BOOST]
+
+        if device.support_away_mode or device.support_advanced_modes:
             self._attr_supported_features |= ClimateEntityFeature.PRESET_MODE
 
-        if self._api.device.support_fan_rate:
+        if device.support_fan_rate:
             self._attr_supported_features |= ClimateEntityFeature.FAN_MODE
 
-        if self._api.device.support_swing_mode:
+        if device.support_swing_mode:
             self._attr_supported_features |= ClimateEntityFeature.SWING_MODE
 
     async def _set(self, settings):
@@ -180,11 +191,6 @@ class DaikinClimate(ClimateEntity):
         if values:
             await self._api.device.set(values)
 
-    @property
-    def unique_id(self):
-        """Return a unique ID."""
-        return self._api.device.mac
-
     @property
     def current_temperature(self):
         """Return the current temperature."""
@@ -195,11 +201,6 @@ class DaikinClimate(ClimateEntity):
         """Return the temperature we try to reach."""
         return self._api.device.target_temperature
 
-    @property
-    def target_temperature_step(self):
-        """Return the supported step of target temperature."""
-        return 1
-
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         await self._set(kwargs)
@@ -208,10 +209,11 @@ class DaikinClimate(ClimateEntity):
     def hvac_action(self) -> HVACAction | None:
         """Return the current state."""
         ret = HA_STATE_TO_CURRENT_HVAC.get(self.hvac_mode)
+        device = self._api.device
         if (
             ret in (HVACAction.COOLING, HVACAction.HEATING)
-            and self._api.device.support_compressor_frequency
-            and self._api.device.compressor_frequency == 0
+            and device.support_compressor_frequency
+            and device.compressor_frequency == 0
         ):
             return HVACAction.IDLE
         return ret
@@ -247,20 +249,16 @@ class DaikinClimate(ClimateEntity):
     @property
     def preset_mode(self):
         """Return the preset_mode."""
+        device = self._api.device
         if (
-            self._api.device.represent(HA_ATTR_TO_DAIKIN[ATTR_PRESET_MODE])[1]
+            device.represent(HA_ATTR_TO_DAIKIN[ATTR_PRESET_MODE])[1]
             == HA_PRESET_TO_DAIKIN[PRESET_AWAY]
         ):
             return PRESET_AWAY
-        if (
-            HA_PRESET_TO_DAIKIN[PRESET_BOOST]
-            in self._api.device.represent(DAIKIN_ATTR_ADVANCED)[1]
-        ):
+        advanced_modes = device.represent(DAIKIN_ATTR_ADVANCED)[1]
+        if HA_PRESET_TO_DAIKIN[PRESET_BOOST] in advanced_modes:
             return PRESET_BOOST
-        if (
-            HA_PRESET_TO_DAIKIN[PRESET_ECO]
-            in self._api.device.represent(DAIKIN_ATTR_ADVANCED)[1]
-        ):
+        if HA_PRESET_TO_DAIKIN[PRESET_ECO] in advanced_modes:
             return PRESET_ECO
         return PRESET_NONE
 
@@ -268,36 +266,19 @@ class DaikinClimate(ClimateEntity):
         """Set preset mode."""
         if preset_mode == PRESET_AWAY:
             await self._api.device.set_holiday(ATTR_STATE_ON)
-        elif preset_mode == PRESET_BOOST:
-            await self._api.device.set_advanced_mode(
-                HA_PRESET_TO_DAIKIN[PRESET_BOOST], ATTR_STATE_ON
-            )
-        elif preset_mode == PRESET_ECO:
+        elif preset_mode in (PRESET_BOOST, PRESET_ECO):
             await self._api.device.set_advanced_mode(
-                HA_PRESET_TO_DAIKIN[PRESET_ECO], ATTR_STATE_ON
+                HA_PRESET_TO_DAIKIN[preset_mode], ATTR_STATE_ON
             )
         else:
-            if self.preset_mode == PRESET_AWAY:
+            current_preset_mode = self.preset_mode
+            if current_preset_mode == PRESET_AWAY:
                 await self._api.device.set_holiday(ATTR_STATE_OFF)
-            elif self.preset_mode == PRESET_BOOST:
+            elif current_preset_mode in (PRESET_BOOST, PRESET_ECO):
                 await self._api.device.set_advanced_mode(
-                    HA_PRESET_TO_DAIKIN[PRESET_BOOST], ATTR_STATE_OFF
-                )
-            elif self.preset_mode == PRESET_ECO:
-                await self._api.device.set_advanced_mode(
-                    HA_PRESET_TO_DAIKIN[PRESET_ECO], ATTR_STATE_OFF
+                    HA_PRESET_TO_DAIKIN[current_preset_mode], ATTR_STATE_OFF
                 )
 
-    @property
-    def preset_modes(self):
-        """List of available preset modes."""
-        ret = [PRESET_NONE]
-        if self._api.device.support_away_mode:
-            ret.append(PRESET_AWAY)
-        if self._api.device.support_advanced_modes:
-            ret += [PRESET_ECO, PRESET_BOOST]
-        return ret
-
     async def async_update(self) -> None:
         """Retrieve latest state."""
         await self._api.async_update()
@@ -311,8 +292,3 @@ class DaikinClimate(ClimateEntity):
         await self._api.device.set(
             {HA_ATTR_TO_DAIKIN[ATTR_HVAC_MODE]: HA_STATE_TO_DAIKIN[HVACMode.OFF]}
         )
-
-    @property
-    def device_info(self):
-        """Return a device description for device registry."""
-        return self._api.device_info
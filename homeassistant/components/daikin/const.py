@@ -1,6 +1,8 @@
 """Constants for Daikin."""
 DOMAIN = "daikin"
 
+MANUFACTURER = "Daikin"
+
 ATTR_TARGET_TEMPERATURE = "target_temperature"
 ATTR_INSIDE_TEMPERATURE = "inside_temperature"
 ATTR_OUTSIDE_TEMPERATURE = "outside_temperature"
@@ -21,7 +21,6 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
@@ -159,27 +158,30 @@ async def async_setup_entry(
 ) -> None:
     """Set up Daikin climate based on config_entry."""
     daikin_api = hass.data[DAIKIN_DOMAIN].get(entry.entry_id)
-    sensors = [ATTR_INSIDE_TEMPERATURE]
-    if daikin_api.device.support_outside_temperature:
-        sensors.append(ATTR_OUTSIDE_TEMPERATURE)
-    if daikin_api.device.support_energy_consumption:
-        sensors.append(ATTR_ENERGY_TODAY)
-        sensors.append(ATTR_COOL_ENERGY)
-        sensors.append(ATTR_HEAT_ENERGY)
-        sensors.append(ATTR_TOTAL_POWER)
-        sensors.append(ATTR_TOTAL_ENERGY_TODAY)
-    if daikin_api.device.support_humidity:
-        sensors.append(ATTR_HUMIDITY)
-        sensors.append(ATTR_TARGET_HUMIDITY)
-    if daikin_api.device.support_compressor_frequency:
-        sensors.append(ATTR_COMPRESSOR_FREQUENCY)
-
-    entities = [
+    device = daikin_api.device
+    sensors = {ATTR_INSIDE_TEMPERATURE}
+    if device.support_outside_temperature:
+        sensors.add(ATTR_OUTSIDE_TEMPERATURE)
+    if device.support_energy_consumption:
+        sensors.update(
+            (
+                ATTR_ENERGY_TODAY,
+                ATTR_COOL_ENERGY,
+                ATTR_HEAT_ENERGY,
+                ATTR_TOTAL_POWER,
+                ATTR_TOTAL_ENERGY_TODAY,
+            )
+        )
+    if device.support_humidity:
+        sensors.update((ATTR_HUMIDITY, ATTR_TARGET_HUMIDITY))
+    if device.support_compressor_frequency:
+        sensors.add(ATTR_COMPRESSOR_FREQUENCY)
+
+    async_add_entities(
         DaikinSensor(daikin_api, description)
         for description in SENSOR_TYPES
         if description.key in sensors
-    ]
-    async_add_entities(entities)
+    )
 
 
 class DaikinSensor(SensorEntity):
@@ -194,11 +196,8 @@ class DaikinSensor(SensorEntity):
         """Initialize the sensor."""
         self.entity_description = description
         self._api = api
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self._api.device.mac}-{self.entity_description.key}"
+        self._attr_unique_id = f"{api.device.mac}-{description.key}"
+        self._attr_device_info = api.device_info
 
     @property
     def native_value(self) -> float | None:
@@ -208,8 +207,3 @@ class DaikinSensor(SensorEntity):
     async def async_update(self) -> None:
         """Retrieve latest state."""
         await self._api.async_update()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return a device description for device registry."""
-        return self._api.device_info
@@ -6,7 +6,6 @@ from typing import Any
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
@@ -39,11 +38,9 @@ async def async_setup_entry(
     switches: list[DaikinZoneSwitch | DaikinStreamerSwitch] = []
     if zones := daikin_api.device.zones:
         switches.extend(
-            [
-                DaikinZoneSwitch(daikin_api, zone_id)
-                for zone_id, zone in enumerate(zones)
-                if zone != ("-", "0")
-            ]
+            DaikinZoneSwitch(daikin_api, zone_id)
+            for zone_id, zone in enumerate(zones)
+            if zone != ("-", "0")
         )
     if daikin_api.device.support_advanced_modes:
         # It isn't possible to find out from the API responses if a specific
@@ -63,11 +60,8 @@ class DaikinZoneSwitch(SwitchEntity):
         """Initialize the zone."""
         self._api = daikin_api
         self._zone_id = zone_id
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self._api.device.mac}-zone{self._zone_id}"
+        self._attr_unique_id = f"{daikin_api.device.mac}-zone{zone_id}"
+        self._attr_device_info = daikin_api.device_info
 
     @property
     def name(self) -> str:
@@ -79,11 +73,6 @@ class DaikinZoneSwitch(SwitchEntity):
         """Return the state of the sensor."""
         return self._api.device.zones[self._zone_id][1] == "1"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return a device description for device registry."""
-        return self._api.device_info
-
     async def async_update(self) -> None:
         """Retrieve latest state."""
         await self._api.async_update()
@@ -107,11 +96,8 @@ class DaikinStreamerSwitch(SwitchEntity):
     def __init__(self, daikin_api: DaikinApi) -> None:
         """Initialize streamer switch."""
         self._api = daikin_api
-
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{self._api.device.mac}-streamer"
+        self._attr_unique_id = f"{daikin_api.device.mac}-streamer"
+        self._attr_device_info = daikin_api.device_info
 
     @property
     def is_on(self) -> bool:
@@ -120,11 +106,6 @@ class DaikinStreamerSwitch(SwitchEntity):
             DAIKIN_ATTR_STREAMER in self._api.device.represent(DAIKIN_ATTR_ADVANCED)[1]
         )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return a device description for device registry."""
-        return self._api.device_info
-
     async def async_update(self) -> None:
         """Retrieve latest state."""
         await self._api.async_update()